@@ -11,7 +11,8 @@ class AuthProviderType(str, Enum):
 class ToolAuthorization(BaseModel):
     """Marks a tool as requiring authorization."""
 
-    model_config = ConfigDict(frozen=True)
+    # Each provider builds its validator when first used, not for every provider at import
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     provider_id: Optional[str] = None
     """The provider ID configured in Arcade that acts as an alias to well-known configuration."""
@@ -1,17 +1,18 @@
 import asyncio
+import functools
 import inspect
 import logging
 import os
 import re
+import sys
 import typing
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from importlib import import_module
 from types import ModuleType
 from typing import (
-    Annotated,
     Any,
     Callable,
     Literal,
@@ -61,6 +62,24 @@ logger = logging.getLogger(__name__)
 InnerWireType = Literal["string", "integer", "number", "boolean", "json"]
 WireType = Union[InnerWireType, Literal["array"]]
 
+_WIRE_TYPES: dict[type, WireType] = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    dict: "json",
+}
+_OUTER_WIRE_TYPES: dict[type, WireType] = {
+    list: "array",
+    dict: "json",
+}
+
+# Size of each memoized per-tool cache below (signatures, definitions, models).
+# The caches hold tool functions strongly; ToolCatalog.clear_cache() releases them.
+_TOOL_CACHE_SIZE = 1024
+
+_NO_DESCRIPTION = "No description provided."
+
 
 @dataclass
 class WireTypeInfo:
@@ -73,7 +92,8 @@ class WireTypeInfo:
     enum_values: list[str] | None = None
 
 
-class ToolMeta(BaseModel):
+@dataclass(slots=True)
+class ToolMeta:
     """
     Metadata for a tool once it's been materialized.
     """
@@ -82,11 +102,12 @@ class ToolMeta(BaseModel):
     toolkit: Optional[str] = None
     package: Optional[str] = None
     path: Optional[str] = None
-    date_added: datetime = Field(default_factory=datetime.now)
-    date_updated: datetime = Field(default_factory=datetime.now)
+    date_added: datetime = field(default_factory=datetime.now)
+    date_updated: datetime = field(default_factory=datetime.now)
 
 
-class MaterializedTool(BaseModel):
+@dataclass(slots=True)
+class MaterializedTool:
     """
     Data structure that holds tool information while stored in the Catalog
     """
@@ -120,6 +141,10 @@ class ToolCatalog(BaseModel):
     """Singleton class that holds all tools for a given worker"""
 
     _tools: dict[FullyQualifiedName, MaterializedTool] = {}
+    # The first tool added under each unversioned name, for lookups without a version
+    _unversioned_tools: dict[FullyQualifiedName, MaterializedTool] = {}
+    # Definitions of all tools, built on first request and reset when a tool is added
+    _definitions: list[ToolDefinition] | None = None
 
     _disabled_tools: set[str] = set()
     _disabled_toolkits: set[str] = set()
@@ -178,8 +203,6 @@ class ToolCatalog(BaseModel):
         Add a function to the catalog as a tool.
         """
 
-        input_model, output_model = create_func_models(tool_func)
-
         if isinstance(toolkit_or_name, Toolkit):
             toolkit = toolkit_or_name
             toolkit_name = toolkit.name
@@ -210,7 +233,11 @@ class ToolCatalog(BaseModel):
             logger.info(f"Toolkit '{toolkit_name!s}' is disabled and will not be cataloged.")
             return
 
-        self._tools[fully_qualified_name] = MaterializedTool(
+        # Built here rather than on first call, so a tool whose parameter or return
+        # types pydantic can't handle is rejected when it is added
+        input_model, output_model = create_func_models(tool_func)
+
+        materialized_tool = MaterializedTool(
             definition=definition,
             tool=tool_func,
             meta=ToolMeta(
@@ -222,6 +249,12 @@ class ToolCatalog(BaseModel):
             input_model=input_model,
             output_model=output_model,
         )
+        self._tools[fully_qualified_name] = materialized_tool
+        self._definitions = None
+        self._unversioned_tools.setdefault(
+            FullyQualifiedName(fully_qualified_name.name, fully_qualified_name.toolkit_name),
+            materialized_tool,
+        )
 
     def add_module(self, module: ModuleType) -> None:
         """
@@ -242,7 +275,8 @@ class ToolCatalog(BaseModel):
         for module_name, tool_names in toolkit.tools.items():
             for tool_name in tool_names:
                 try:
-                    module = import_module(module_name)
+                    # Tools of a module share it; skip the import machinery once it's loaded
+                    module = sys.modules.get(module_name) or import_module(module_name)
                     tool_func = getattr(module, tool_name)
                     self.add_tool(tool_func, toolkit, module)
 
@@ -277,7 +311,18 @@ class ToolCatalog(BaseModel):
         return len(self._tools) == 0
 
     def get_tool_names(self) -> list[FullyQualifiedName]:
-        return [tool.definition.get_fully_qualified_name() for tool in self._tools.values()]
+        # Tools are keyed by the fully-qualified name of their definition
+        return list(self._tools)
+
+    def get_tool_definitions(self) -> list[ToolDefinition]:
+        """
+        Get the definitions of all tools in the catalog.
+
+        The list is shared between calls until a tool is added, so it must not be modified.
+        """
+        if self._definitions is None:
+            self._definitions = [tool.definition for tool in self._tools.values()]
+        return self._definitions
 
     def find_tool_by_func(self, func: Callable) -> ToolDefinition:
         """
@@ -337,11 +382,10 @@ class ToolCatalog(BaseModel):
             except KeyError:
                 raise ValueError(f"Tool {name}@{name.toolkit_version} not found in the catalog.")
 
-        for key, tool in self._tools.items():
-            if key.equals_ignoring_version(name):
-                return tool
-
-        raise ValueError(f"Tool {name} not found.")
+        try:
+            return self._unversioned_tools[FullyQualifiedName(name.name, name.toolkit_name)]
+        except KeyError:
+            raise ValueError(f"Tool {name} not found.")
 
     def get_tool_count(self) -> int:
         """
@@ -349,7 +393,22 @@ class ToolCatalog(BaseModel):
         """
         return len(self._tools)
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget the memoized tool definitions and models, e.g. after a tool function was redefined.
+        """
+        cls.create_tool_definition.cache_clear()
+        create_input_definition.cache_clear()
+        create_output_definition.cache_clear()
+        create_func_models.cache_clear()
+        _cached_input_model.cache_clear()
+        _cached_output_model.cache_clear()
+        _shared_value_schema.cache_clear()
+        _cached_signature.cache_clear()
+
     @staticmethod
+    @functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
     def create_tool_definition(
         tool: Callable,
         toolkit_name: str,
@@ -358,17 +417,22 @@ class ToolCatalog(BaseModel):
     ) -> ToolDefinition:
         """
         Given a tool function, create a ToolDefinition
+
+        Definitions are memoized per (tool, toolkit name, version, description); they
+        are treated as immutable, so the same instance is shared between catalogs.
         """
 
-        raw_tool_name = getattr(tool, "__tool_name__", tool.__name__)
+        tool_attrs = _tool_attributes(tool)
+        raw_tool_name = tool_attrs.get("__tool_name__", tool.__name__)
 
         # Hard requirement: tools must have descriptions
-        tool_description = getattr(tool, "__tool_description__", None)
+        tool_description = tool_attrs.get("__tool_description__")
         if not tool_description:
             raise ToolDefinitionError(f"Tool {raw_tool_name} is missing a description")
 
-        # If the function returns a value, it must have a type annotation
-        if does_function_return_value(tool) and tool.__annotations__.get("return") is None:
+        # If the function returns a value, it must have a type annotation.
+        # Check the annotation first: reading and parsing the source is only needed without one
+        if tool.__annotations__.get("return") is None and does_function_return_value(tool):
             raise ToolDefinitionError(f"Tool {raw_tool_name} must have a return type annotation")
 
         auth_requirement = create_auth_requirement(tool)
@@ -383,7 +447,7 @@ class ToolCatalog(BaseModel):
 
         tool_name = snake_to_pascal_case(raw_tool_name)
         fully_qualified_name = FullyQualifiedName.from_toolkit(tool_name, toolkit_definition)
-        deprecation_message = getattr(tool, "__tool_deprecation_message__", None)
+        deprecation_message = tool_attrs.get("__tool_deprecation_message__")
 
         return ToolDefinition(
             name=tool_name,
@@ -401,14 +465,67 @@ class ToolCatalog(BaseModel):
         )
 
 
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """
+    Return `inspect.signature(func, follow_wrapped=True)`, computed once per function.
+    """
+    return inspect.signature(func, follow_wrapped=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _shared_value_schema(
+    val_type: WireType, inner_val_type: InnerWireType | None, enum: tuple[str, ...] | None
+) -> ValueSchema:
+    return ValueSchema(
+        val_type=val_type,
+        inner_val_type=inner_val_type,
+        enum=list(enum) if enum is not None else None,
+    )
+
+
+def _value_schema(wire_type_info: WireTypeInfo) -> ValueSchema:
+    """
+    Return the value schema for a wire type, shared by all parameters and outputs of that type.
+    """
+    enum = wire_type_info.enum_values
+    try:
+        return _shared_value_schema(
+            wire_type_info.wire_type,
+            wire_type_info.inner_wire_type,
+            tuple(enum) if enum is not None else None,
+        )
+    except TypeError:
+        # Unhashable enum values: build a schema of its own (validation reports the error)
+        return ValueSchema(
+            val_type=wire_type_info.wire_type,
+            inner_val_type=wire_type_info.inner_wire_type,
+            enum=enum,
+        )
+
+
+def _tool_attributes(tool: Callable) -> dict[str, Any]:
+    """
+    Return the attributes the @tool decorators set on a tool function.
+
+    They live in the function's __dict__ (bound methods expose their function's), so
+    plain dict lookups replace a getattr() with a default for each attribute.
+    """
+    return getattr(tool, "__dict__", {})
+
+
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
 def create_input_definition(func: Callable) -> ToolInput:
     """
     Create an input model for a function based on its parameters.
+
+    Only depends on the function, so definitions of the same tool in several
+    toolkits or toolkit versions share it.
     """
     input_parameters = []
     tool_context_param_name: str | None = None
 
-    for _, param in inspect.signature(func, follow_wrapped=True).parameters.items():
+    for _, param in _cached_signature(func).parameters.items():
         if param.annotation is ToolContext:
             if tool_context_param_name is not None:
                 raise ToolDefinitionError(
@@ -425,37 +542,36 @@ def create_input_definition(func: Callable) -> ToolInput:
         has_default_value = tool_field_info.default is not None
         is_required = not tool_field_info.is_optional and not has_default_value
 
+        # The fields were checked by extract_field_info (str name and description, bool flags),
+        # so skip re-validating them. The value schema is still validated: enum values
+        # taken from an Enum may not be strings.
         input_parameters.append(
-            InputParameter(
+            InputParameter.model_construct(
                 name=tool_field_info.name,
                 description=tool_field_info.description,
                 required=is_required,
                 inferrable=tool_field_info.is_inferrable,
-                value_schema=ValueSchema(
-                    val_type=tool_field_info.wire_type_info.wire_type,
-                    inner_val_type=tool_field_info.wire_type_info.inner_wire_type,
-                    enum=tool_field_info.wire_type_info.enum_values,
-                ),
+                value_schema=_value_schema(tool_field_info.wire_type_info),
             )
         )
 
-    return ToolInput(
+    # Every parameter was built above, so the container needs no validation either
+    return ToolInput.model_construct(
         parameters=input_parameters, tool_context_parameter_name=tool_context_param_name
     )
 
 
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
 def create_output_definition(func: Callable) -> ToolOutput:
     """
     Create an output model for a function based on its return annotation.
     """
-    return_type = inspect.signature(func, follow_wrapped=True).return_annotation
-    description = "No description provided."
+    return_type = _cached_signature(func).return_annotation
+    description = _NO_DESCRIPTION
 
     if return_type is inspect.Signature.empty:
-        return ToolOutput(
-            value_schema=None,
-            description="No description provided.",
-            available_modes=["null"],
+        return ToolOutput.model_construct(
+            value_schema=None, description=_NO_DESCRIPTION, available_modes=["null"]
         )
 
     if hasattr(return_type, "__metadata__"):
@@ -466,7 +582,7 @@ def create_output_definition(func: Callable) -> ToolOutput:
     # Both Optional[T] and T | None are supported
     is_optional = is_strict_optional(return_type)
     if is_optional:
-        return_type = next(arg for arg in get_args(return_type) if arg is not type(None))
+        return_type = unwrap_optional(return_type)
 
     wire_type_info = get_wire_type_info(return_type)
 
@@ -478,11 +594,7 @@ def create_output_definition(func: Callable) -> ToolOutput:
     return ToolOutput(
         description=description,
         available_modes=available_modes,
-        value_schema=ValueSchema(
-            val_type=wire_type_info.wire_type,
-            inner_val_type=wire_type_info.inner_wire_type,
-            enum=wire_type_info.enum_values,
-        ),
+        value_schema=_value_schema(wire_type_info),
     )
 
 
@@ -490,7 +602,7 @@ def create_auth_requirement(tool: Callable) -> ToolAuthRequirement | None:
     """
     Create an auth requirement for a tool.
     """
-    auth_requirement = getattr(tool, "__tool_requires_auth__", None)
+    auth_requirement = _tool_attributes(tool).get("__tool_requires_auth__")
     if isinstance(auth_requirement, ToolAuthorization):
         new_auth_requirement = ToolAuthRequirement(
             provider_id=auth_requirement.provider_id,
@@ -508,8 +620,9 @@ def create_secrets_requirement(tool: Callable) -> list[ToolSecretRequirement] |
     """
     Create a secrets requirement for a tool.
     """
-    raw_tool_name = getattr(tool, "__tool_name__", tool.__name__)
-    secrets_requirement = getattr(tool, "__tool_requires_secrets__", None)
+    tool_attrs = _tool_attributes(tool)
+    raw_tool_name = tool_attrs.get("__tool_name__", tool.__name__)
+    secrets_requirement = tool_attrs.get("__tool_requires_secrets__")
     if isinstance(secrets_requirement, list):
         if any(not isinstance(secret, str) for secret in secrets_requirement):
             raise ToolDefinitionError(
@@ -531,8 +644,9 @@ def create_metadata_requirement(
     """
     Create a metadata requirement for a tool.
     """
-    raw_tool_name = getattr(tool, "__tool_name__", tool.__name__)
-    metadata_requirement = getattr(tool, "__tool_requires_metadata__", None)
+    tool_attrs = _tool_attributes(tool)
+    raw_tool_name = tool_attrs.get("__tool_name__", tool.__name__)
+    metadata_requirement = tool_attrs.get("__tool_requires_metadata__")
     if isinstance(metadata_requirement, list):
         for metadata in metadata_requirement:
             if not isinstance(metadata, str):
@@ -619,7 +733,8 @@ def extract_field_info(param: inspect.Parameter) -> ToolParamInfo:
     else:
         param_info = extract_python_param_info(param)
 
-    metadata = getattr(annotation, "__metadata__", [])
+    # Only Annotated[] carries metadata; anything else has no descriptions or Inferrable
+    metadata = getattr(annotation, "__metadata__", ())
     str_annotations = [m for m in metadata if isinstance(m, str)]
 
     # Get the description from annotations, if present
@@ -643,7 +758,7 @@ def extract_field_info(param: inspect.Parameter) -> ToolParamInfo:
         )
 
     # Get the Inferrable annotation, if it exists
-    inferrable_annotation = first_or_none(Inferrable, get_args(annotation))
+    inferrable_annotation = first_or_none(Inferrable, metadata)
 
     # Params are inferrable by default
     is_inferrable = inferrable_annotation.value if inferrable_annotation else True
@@ -669,52 +784,67 @@ def get_wire_type_info(_type: type) -> WireTypeInfo:
     # Is this a list type?
     # If so, get the inner (enclosed) type
     is_list = get_origin(_type) is list
+    type_to_check = get_args(_type)[0] if is_list else _type
+
+    # Literal["string1", "string2"] is sent as a string; check it once for both wire types
+    is_literal = is_string_literal(type_to_check)
+
     if is_list:
-        inner_type = get_args(_type)[0]
         inner_wire_type = cast(
             InnerWireType,
-            get_wire_type(str) if is_string_literal(inner_type) else get_wire_type(inner_type),
+            _WIRE_TYPES[str] if is_literal else get_wire_type(type_to_check),
         )
+        wire_type = get_wire_type(_type)
     else:
         inner_wire_type = None
-
-    # Get the outer wire type
-    wire_type = get_wire_type(str) if is_string_literal(_type) else get_wire_type(_type)
+        wire_type = _WIRE_TYPES[str] if is_literal else get_wire_type(_type)
 
     # Handle enums (known/fixed lists of values)
     is_enum = False
     enum_values: list[str] = []
 
-    type_to_check = inner_type if is_list else _type
-
-    # Strip generic parameters if type_to_check is a parameterized generic
-    actual_type = get_origin(type_to_check) or type_to_check
-
     # Special case: Literal["string1", "string2"] can be enumerated on the wire
-    if is_string_literal(type_to_check):
+    if is_literal:
         is_enum = True
         enum_values = [str(e) for e in get_args(type_to_check)]
 
     # Special case: Enum can be enumerated on the wire
-    elif issubclass(actual_type, Enum):
-        is_enum = True
-        enum_values = [e.value for e in actual_type]  # type: ignore[union-attr]
+    else:
+        # Strip generic parameters if type_to_check is a parameterized generic
+        actual_type = get_origin(type_to_check) or type_to_check
+        if issubclass(actual_type, Enum):
+            is_enum = True
+            enum_values = [e.value for e in actual_type]  # type: ignore[union-attr]
 
     return WireTypeInfo(wire_type, inner_wire_type, enum_values if is_enum else None)
 
 
+def unwrap_annotated(annotation: Any) -> Any:
+    """
+    Return the type wrapped by an Annotated[] annotation, or the annotation itself.
+    """
+    return annotation.__args__[0] if hasattr(annotation, "__metadata__") else annotation
+
+
+def unwrap_optional(_type: Any) -> Any:
+    """
+    Return T for a strict optional type: Optional[T], Union[T, None] or T | None.
+    """
+    first, second = get_args(_type)
+    return second if first is type(None) else first
+
+
 def extract_python_param_info(param: inspect.Parameter) -> ParamInfo:
     # If the param is Annotated[], unwrap the annotation to get the "real" type
     # Otherwise, use the literal type
-    annotation = param.annotation
-    original_type = annotation.__args__[0] if get_origin(annotation) is Annotated else annotation
+    original_type = unwrap_annotated(param.annotation)
     field_type = original_type
 
     # Handle optional types
     # Both Optional[T] and T | None are supported
     is_optional = is_strict_optional(field_type)
     if is_optional:
-        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+        field_type = unwrap_optional(field_type)
 
     # Union types are not currently supported
     # (other than optional, which is handled above)
@@ -743,18 +873,14 @@ def extract_pydantic_param_info(param: inspect.Parameter) -> ParamInfo:
 
     # If the param is Annotated[], unwrap the annotation to get the "real" type
     # Otherwise, use the literal type
-    original_type = (
-        param.annotation.__args__[0]
-        if get_origin(param.annotation) is Annotated
-        else param.annotation
-    )
+    original_type = unwrap_annotated(param.annotation)
     field_type = original_type
 
     # Unwrap Optional types
     # Both Optional[T] and T | None are supported
     is_optional = is_strict_optional(field_type)
     if is_optional:
-        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+        field_type = unwrap_optional(field_type)
 
     return ParamInfo(
         name=param.name,
@@ -773,23 +899,12 @@ def get_wire_type(
     Mapping between Python types and HTTP/JSON types
     """
     # TODO ensure Any is not allowed
-    type_mapping: dict[type, WireType] = {
-        str: "string",
-        bool: "boolean",
-        int: "integer",
-        float: "number",
-        dict: "json",
-    }
-    outer_type_mapping: dict[type, WireType] = {
-        list: "array",
-        dict: "json",
-    }
-    wire_type = type_mapping.get(_type)
+    wire_type = _WIRE_TYPES.get(_type)
     if wire_type:
         return wire_type
 
     if hasattr(_type, "__origin__"):
-        wire_type = outer_type_mapping.get(cast(type, get_origin(_type)))
+        wire_type = _OUTER_WIRE_TYPES.get(cast(type, get_origin(_type)))
         if wire_type:
             return wire_type
 
@@ -802,43 +917,55 @@ def get_wire_type(
     raise ToolDefinitionError(f"Unsupported parameter type: {_type}")
 
 
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
 def create_func_models(func: Callable) -> tuple[type[BaseModel], type[BaseModel]]:
     """
     Analyze a function to create corresponding Pydantic models for its input and output.
+
+    The models are memoized per function, since building them with `create_model` is costly.
     """
-    input_fields = {}
+    input_fields = []
     # TODO figure this out (Sam)
     if asyncio.iscoroutinefunction(func) and hasattr(func, "__wrapped__"):
         func = func.__wrapped__
-    for name, param in inspect.signature(func, follow_wrapped=True).parameters.items():
+    signature = _cached_signature(func)
+    for name, param in signature.parameters.items():
         # Skip ToolContext parameters
         if param.annotation is ToolContext:
             continue
 
         # TODO make this cleaner
         tool_field_info = extract_field_info(param)
-        param_fields = {
-            "default": tool_field_info.default,
-            "description": tool_field_info.description,
-            # TODO more here?
-        }
-        input_fields[name] = (tool_field_info.field_type, Field(**param_fields))
-
-    input_model = create_model(f"{snake_to_pascal_case(func.__name__)}Input", **input_fields)  # type: ignore[call-overload]
+        input_fields.append((
+            name,
+            tool_field_info.field_type,
+            tool_field_info.default,
+            tool_field_info.description,
+        ))
+
+    input_model = _create_input_model(
+        f"{snake_to_pascal_case(func.__name__)}Input", tuple(input_fields)
+    )
 
-    output_model = determine_output_model(func)
+    output_model = determine_output_model(func, signature)
 
     return input_model, output_model
 
 
-def determine_output_model(func: Callable) -> type[BaseModel]:
+def determine_output_model(
+    func: Callable, signature: inspect.Signature | None = None
+) -> type[BaseModel]:
     """
     Determine the output model for a function based on its return annotation.
+
+    `signature` can be passed when the caller already has the function's signature.
     """
-    return_annotation = inspect.signature(func).return_annotation
+    if signature is None:
+        signature = _cached_signature(func)
+    return_annotation = signature.return_annotation
     output_model_name = f"{snake_to_pascal_case(func.__name__)}Output"
     if return_annotation is inspect.Signature.empty:
-        return create_model(output_model_name)
+        return _create_output_model(output_model_name)
     elif hasattr(return_annotation, "__origin__"):
         if hasattr(return_annotation, "__metadata__"):
             field_type = return_annotation.__args__[0]
@@ -846,10 +973,7 @@ def determine_output_model(func: Callable) -> type[BaseModel]:
                 return_annotation.__metadata__[0] if return_annotation.__metadata__ else ""
             )
             if description:
-                return create_model(
-                    output_model_name,
-                    result=(field_type, Field(description=str(description))),
-                )
+                return _create_output_model(output_model_name, field_type, str(description))
         # Handle Union types
         origin = return_annotation.__origin__
         if origin is typing.Union:
@@ -857,25 +981,70 @@ def determine_output_model(func: Callable) -> type[BaseModel]:
             # TODO handle multiple non-None arguments. Raise error?
             for arg in get_args(return_annotation):
                 if arg is not type(None):
-                    return create_model(
-                        output_model_name,
-                        result=(arg, Field(description="No description provided.")),
-                    )
+                    return _create_output_model(output_model_name, arg)
         # when the return_annotation has an __origin__ attribute
         # and does not have a __metadata__ attribute.
-        return create_model(
-            output_model_name,
-            result=(
-                return_annotation,
-                Field(description="No description provided."),
-            ),
-        )
+        return _create_output_model(output_model_name, return_annotation)
     else:
         # Handle simple return types (like str)
-        return create_model(
-            output_model_name,
-            result=(return_annotation, Field(description="No description provided.")),
-        )
+        return _create_output_model(output_model_name, return_annotation)
+
+
+def _create_input_model(
+    name: str, fields: tuple[tuple[str, Any, Any, str | None], ...]
+) -> type[BaseModel]:
+    """
+    Create an input model from (name, type, default, description) fields.
+
+    Like output models, input models are shared between tools with the same name and
+    fields (e.g. one tool in several versions of a toolkit). Fields with unhashable
+    types or defaults get a new model every time.
+    """
+    # The default's type is part of the key, so that e.g. a default of 1 and True don't share
+    key = tuple((*field, type(field[2])) for field in fields)
+    try:
+        hash(key)
+    except TypeError:
+        return _build_input_model(name, key)
+    return _cached_input_model(name, key)
+
+
+def _build_input_model(name: str, fields: tuple[tuple[Any, ...], ...]) -> type[BaseModel]:
+    input_fields = {
+        field_name: (field_type, Field(default=default, description=description))
+        for field_name, field_type, default, description, _ in fields
+    }
+    return create_model(name, **input_fields)  # type: ignore[call-overload, no-any-return]
+
+
+_cached_input_model = functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)(_build_input_model)
+
+
+def _create_output_model(
+    name: str,
+    result_type: Any = inspect.Signature.empty,
+    description: str = _NO_DESCRIPTION,
+) -> type[BaseModel]:
+    """
+    Create an output model with a single `result` field, or no fields if there is no result type.
+
+    Models are shared between tools with the same name and result type. Types that
+    can't be hashed (e.g. Annotated[] with dict metadata) get a new model every time.
+    """
+    try:
+        hash(result_type)
+    except TypeError:
+        return _build_output_model(name, result_type, description)
+    return _cached_output_model(name, result_type, description)
+
+
+def _build_output_model(name: str, result_type: Any, description: str) -> type[BaseModel]:
+    if result_type is inspect.Signature.empty:
+        return create_model(name)
+    return create_model(name, result=(result_type, Field(description=description)))
+
+
+_cached_output_model = functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)(_build_output_model)
 
 
 def to_tool_secret_requirements(
@@ -1,5 +1,7 @@
-import asyncio
+import functools
+import inspect
 import traceback
+from enum import Enum
 from typing import Any, Callable
 
 from pydantic import BaseModel, ValidationError
@@ -14,6 +16,20 @@ from arcade.core.errors import (
 from arcade.core.output import output_factory
 from arcade.core.schema import ToolCallLog, ToolCallOutput, ToolContext, ToolDefinition
 
+# Argument types that model_dump() returns unchanged
+_SCALAR_TYPES = (str, int, float, bool, Enum, type(None))
+
+
+@functools.lru_cache(maxsize=256)
+def _deprecation_log(message: str) -> ToolCallLog:
+    """
+    Build the deprecation log for a deprecated tool.
+
+    The log only depends on the deprecation message, so it is built once per message
+    instead of on every call of the tool.
+    """
+    return ToolCallLog(message=message, level="warning", subtype="deprecation")
+
 
 class ToolExecutor:
     @staticmethod
@@ -32,31 +48,31 @@ class ToolExecutor:
         # only gathering deprecation log for now
         tool_call_logs = []
         if definition.deprecation_message is not None:
-            tool_call_logs.append(
-                ToolCallLog(
-                    message=definition.deprecation_message, level="warning", subtype="deprecation"
-                )
-            )
+            tool_call_logs.append(_deprecation_log(definition.deprecation_message))
 
         try:
             # serialize the input model
-            inputs = await ToolExecutor._serialize_input(input_model, **kwargs)
+            inputs = ToolExecutor._serialize_input(input_model, **kwargs)
 
-            # prepare the arguments for the function call
-            func_args = inputs.model_dump()
+            # prepare the arguments for the function call. model_dump() only differs from
+            # the model's own field values for nested models and containers, so skip its
+            # recursive walk when every argument is a plain scalar
+            func_args = dict(inputs)
+            if not all(isinstance(value, _SCALAR_TYPES) for value in func_args.values()):
+                func_args = inputs.model_dump()
 
             # inject ToolContext, if the target function supports it
             if definition.input.tool_context_parameter_name is not None:
                 func_args[definition.input.tool_context_parameter_name] = context
 
-            # execute the tool function
-            if asyncio.iscoroutinefunction(func):
-                results = await func(**func_args)
-            else:
-                results = func(**func_args)
+            # execute the tool function. The `tool` decorator already picked a sync or
+            # async wrapper, so await the result instead of inspecting `func` per call.
+            results = func(**func_args)
+            if inspect.isawaitable(results):
+                results = await results
 
             # serialize the output model
-            output = await ToolExecutor._serialize_output(output_model, results)
+            output = ToolExecutor._serialize_output(output_model, results)
 
             # return the output
             return output_factory.success(data=output, logs=tool_call_logs)
@@ -89,7 +105,7 @@ class ToolExecutor:
             )
 
     @staticmethod
-    async def _serialize_input(input_model: type[BaseModel], **kwargs: Any) -> BaseModel:
+    def _serialize_input(input_model: type[BaseModel], **kwargs: Any) -> BaseModel:
         """
         Serialize the input to a tool function.
         """
@@ -107,7 +123,7 @@ class ToolExecutor:
         return inputs
 
     @staticmethod
-    async def _serialize_output(output_model: type[BaseModel], results: dict) -> BaseModel:
+    def _serialize_output(output_model: type[BaseModel], results: dict) -> BaseModel:
         """
         Serialize the output of a tool function.
         """
@@ -1,4 +1,5 @@
 import ast
+import os
 from pathlib import Path
 from typing import Optional, Union
 
@@ -42,12 +43,30 @@ def get_function_name_if_decorated(
     return None
 
 
+# Tool names found in each file, keyed by path and invalidated when the file changes
+_tools_by_file: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+
 def get_tools_from_file(filepath: str | Path) -> list[str]:
     """
     Retrieve tools from a Python file.
+
+    Files are only parsed again when their modification time or size changes, so
+    reloading a toolkit doesn't re-parse every module.
     """
-    tree = load_ast_tree(filepath)
-    return get_tools_from_ast(tree)
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File {filepath} not found")
+
+    key = str(filepath)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _tools_by_file.get(key)
+    if cached is None or cached[0] != version:
+        tree = load_ast_tree(filepath)
+        cached = (version, get_tools_from_ast(tree))
+        _tools_by_file[key] = cached
+    return list(cached[1])
 
 
 def get_tools_from_ast(tree: ast.AST) -> list[str]:
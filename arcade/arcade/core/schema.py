@@ -12,6 +12,9 @@ TOOL_NAME_SEPARATOR = os.getenv("ARCADE_TOOL_NAME_SEPARATOR", ".")
 class ValueSchema(BaseModel):
     """Value schema for input parameters and outputs."""
 
+    # Frozen: the catalog shares one instance between all values of the same type
+    model_config = {"defer_build": True, "frozen": True}
+
     val_type: Literal["string", "integer", "number", "boolean", "json", "array"]
     """The type of the value."""
 
@@ -25,6 +28,8 @@ class ValueSchema(BaseModel):
 class InputParameter(BaseModel):
     """A parameter that can be passed to a tool."""
 
+    model_config = {"defer_build": True}
+
     name: str = Field(..., description="The human-readable name of this parameter.")
     required: bool = Field(
         ...,
@@ -46,6 +51,8 @@ class InputParameter(BaseModel):
 class ToolInput(BaseModel):
     """The inputs that a tool accepts."""
 
+    model_config = {"defer_build": True}
+
     parameters: list[InputParameter]
     """The list of parameters that the tool accepts."""
 
@@ -59,6 +66,8 @@ class ToolInput(BaseModel):
 class ToolOutput(BaseModel):
     """The output of a tool."""
 
+    model_config = {"defer_build": True}
+
     description: Optional[str] = Field(
         None, description="A descriptive, human-readable explanation of the output."
     )
@@ -74,6 +83,8 @@ class ToolOutput(BaseModel):
 class OAuth2Requirement(BaseModel):
     """Indicates that the tool requires OAuth 2.0 authorization."""
 
+    model_config = {"defer_build": True}
+
     scopes: Optional[list[str]] = None
     """The scope(s) needed for the authorized action."""
 
@@ -81,6 +92,8 @@ class OAuth2Requirement(BaseModel):
 class ToolAuthRequirement(BaseModel):
     """A requirement for authorization to use a tool."""
 
+    model_config = {"defer_build": True}
+
     # Provider ID, Type, and ID needed for the Arcade Engine to look up the auth provider.
     # However, the developer generally does not need to set these directly.
     # Instead, they will use:
@@ -106,6 +119,8 @@ class ToolAuthRequirement(BaseModel):
 class ToolSecretRequirement(BaseModel):
     """A requirement for a tool to run."""
 
+    model_config = {"defer_build": True}
+
     key: str
     """The ID of the secret."""
 
@@ -126,6 +141,8 @@ class ToolMetadataKey(str, Enum):
 class ToolMetadataRequirement(BaseModel):
     """A requirement for a tool to run."""
 
+    model_config = {"defer_build": True}
+
     key: str
     """The ID of the metadata."""
 
@@ -133,6 +150,8 @@ class ToolMetadataRequirement(BaseModel):
 class ToolRequirements(BaseModel):
     """The requirements for a tool to run."""
 
+    model_config = {"defer_build": True}
+
     authorization: Union[ToolAuthRequirement, None] = None
     """The authorization requirements for the tool, if any."""
 
@@ -146,6 +165,8 @@ class ToolRequirements(BaseModel):
 class ToolkitDefinition(BaseModel):
     """The specification of a toolkit."""
 
+    model_config = {"defer_build": True}
+
     name: str
     """The name of the toolkit."""
 
@@ -204,6 +225,8 @@ class FullyQualifiedName:
 class ToolDefinition(BaseModel):
     """The specification of a tool."""
 
+    model_config = {"defer_build": True}
+
     name: str
     """The name of the tool."""
 
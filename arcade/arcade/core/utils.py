@@ -1,4 +1,5 @@
 import ast
+import functools
 import inspect
 import re
 from collections.abc import Iterable
@@ -7,6 +8,11 @@ from typing import Any, Callable, Literal, Optional, TypeVar, Union, get_args, g
 
 T = TypeVar("T")
 
+# Word boundaries for pascal_to_snake_case: an uppercase letter starting a word,
+# and a lowercase letter or digit followed by an uppercase letter
+_WORD_START_PATTERN = re.compile("(.)([A-Z][a-z]+)")
+_CASE_BOUNDARY_PATTERN = re.compile("([a-z0-9])([A-Z])")
+
 
 def first_or_none(_type: type[T], iterable: Iterable[Any]) -> Optional[T]:
     """
@@ -22,13 +28,16 @@ def pascal_to_snake_case(name: str) -> str:
     """
     Converts a PascalCase name to snake_case.
     """
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = _WORD_START_PATTERN.sub(r"\1_\2", name)
+    return _CASE_BOUNDARY_PATTERN.sub(r"\1_\2", name).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def snake_to_pascal_case(name: str) -> str:
     """
     Converts a snake_case name to PascalCase.
+
+    Tool and toolkit names are converted many times while catalogs are built, so results are cached.
     """
     if "_" in name:
         return "".join(x.capitalize() or "_" for x in name.split("_"))
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import pytz
 from dateutil import parser
 
 from arcade.sdk.errors import WeightError
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class Critic(ABC):
@@ -22,6 +25,33 @@ class Critic(ABC):
     def evaluate(self, expected: Any, actual: Any) -> dict[str, Any]:
         pass
 
+    def to_numeric(self, value: Any) -> float:
+        """
+        Convert a field value to the float consumed by `evaluate_batch`.
+
+        Raises:
+            TypeError, ValueError: If the value cannot be represented as a number.
+        """
+        return float(value)
+
+    def evaluate_batch(self, expected: "np.ndarray", actual: "np.ndarray") -> dict[str, Any] | None:
+        """
+        Evaluate every pair of broadcast expected and actual values at once.
+
+        Critics whose score can be computed with NumPy override this so the cost
+        matrix needs one call per critic instead of one `evaluate` call per cell.
+        It is only used when the class that defines it also defines `evaluate`.
+
+        Args:
+            expected: Values prepared by `to_numeric`, shaped (N, 1).
+            actual: Values prepared by `to_numeric`, shaped (1, M).
+
+        Returns:
+            A dict with (N, M) "match" and "score" arrays, or None if the critic only
+            supports `evaluate`.
+        """
+        return None
+
 
 @dataclass
 class NoneCritic(Critic):
@@ -153,6 +183,11 @@ class NumericCritic(Critic):
         self.value_range = value_range
         self.match_threshold = match_threshold
 
+    def to_numeric(self, value: Any) -> float:
+        """Normalize a value to a 0-1 scale based on value_range."""
+        min_val, max_val = self.value_range
+        return float((float(value) - min_val) / (max_val - min_val))
+
     def evaluate(self, expected: Any, actual: Any) -> dict[str, Any]:
         min_val, max_val = self.value_range
         normalized_expected = float((float(expected) - min_val) / (max_val - min_val))
@@ -160,6 +195,10 @@ class NumericCritic(Critic):
         score = float(1 - abs(normalized_expected - normalized_actual))
         return {"match": bool(score >= self.match_threshold), "score": float(score * self.weight)}
 
+    def evaluate_batch(self, expected: "np.ndarray", actual: "np.ndarray") -> dict[str, Any]:
+        similarity = 1.0 - abs(expected - actual)
+        return {"match": similarity >= self.match_threshold, "score": similarity * self.weight}
+
 
 @dataclass
 class SimilarityCritic(Critic):
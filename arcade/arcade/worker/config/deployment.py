@@ -1,9 +1,15 @@
 import base64
+import functools
 import io
+import logging
 import os
 import re
 import secrets
+import stat
+import sys
 import tarfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +20,51 @@ from httpx import Client
 from packaging.requirements import Requirement
 from pydantic import BaseModel, field_serializer, field_validator, model_validator
 
+logger = logging.getLogger(__name__)
+
+# Read deployment files with the standard library's tomllib where available; the
+# toml package is still needed to write them and to read them on Python 3.10
+if sys.version_info >= (3, 11):
+    import tomllib
+
+    TomlDecodeError: type[ValueError] = tomllib.TOMLDecodeError
+
+    def load_toml(toml_path: Path) -> dict[str, Any]:
+        with open(toml_path, "rb") as f:
+            return tomllib.load(f)
+
+else:
+    TomlDecodeError = toml.TomlDecodeError
+
+    def load_toml(toml_path: Path) -> dict[str, Any]:
+        with open(toml_path) as f:
+            return toml.load(f)
+
+
+# gzip level for local package uploads. tarfile defaults to 9, which takes about twice
+# as long as 6 for a ~1.5% smaller archive; 1 is faster still but ~25% larger.
+PACKAGE_COMPRESS_LEVEL = 6
+
+# Directories and files that are never needed to install a local package
+EXCLUDED_PACKAGE_DIRS = frozenset({
+    "__pycache__",
+    ".git",
+    ".venv",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
+EXCLUDED_PACKAGE_SUFFIXES = (".pyc", ".pyo")
+
+
+def _exclude_build_artifacts(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
+    """tarfile filter that drops caches, VCS metadata and bytecode from local packages."""
+    if tarinfo.name.endswith(EXCLUDED_PACKAGE_SUFFIXES):
+        return None
+    if not EXCLUDED_PACKAGE_DIRS.isdisjoint(tarinfo.name.split("/")):
+        return None
+    return tarinfo
+
 
 # Base class for versioned packages
 class Package(BaseModel):
@@ -22,8 +73,16 @@ class Package(BaseModel):
 
     @classmethod
     def from_requirement(cls, requirement_str: str) -> "Package":
-        req = Requirement(requirement_str)
-        return cls(name=req.name, specifier=str(req.specifier) if req.specifier else None)
+        name, specifier = _parse_requirement(requirement_str)
+        # Both values come straight from the parsed requirement
+        return cls.model_construct(name=name, specifier=specifier)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_requirement(requirement_str: str) -> tuple[str, str | None]:
+    """Parse a PEP 508 requirement string once per distinct string."""
+    req = Requirement(requirement_str)
+    return req.name, str(req.specifier) if req.specifier else None
 
 
 # Base class for a list of packages
@@ -89,7 +148,7 @@ class Config(BaseModel):
         else:
             raise TypeError("Secret must be a string or a Secret object")
         # Check that the secret is not the default dev secret or empty
-        if secret.value.strip() == "" or secret.value == "dev":
+        if not secret.value.strip() or secret.value == "dev":
             raise ValueError("Secret must be a non-empty string and not 'dev'")
         return secret
 
@@ -120,7 +179,8 @@ class Request(BaseModel):
         # Attempt to deploy worker to the cloud
         try:
             cloud_response = cloud_client.put(
-                str(cloud_client.base_url) + "/api/v1/workers",
+                # Relative to the client's base_url, so httpx joins it without building a string
+                "/api/v1/workers",
                 json=self.model_dump(mode="json"),
                 timeout=120,
             )
@@ -131,14 +191,18 @@ class Request(BaseModel):
             msg = cloud_response.json().get("msg", f"{cloud_response.status_code}: Unknown error")
             raise ValueError(f"Failed to start worker: {msg}")
 
+        # Parse the response once; it's returned and both engine calls need its endpoint
+        cloud_data = cloud_response.json()
+
         try:
+            worker_endpoint = cloud_data["data"]["worker_endpoint"]
             # Check if worker already exists
             engine_client.workers.get(self.name)
             engine_client.workers.update(
                 id=self.name,
                 enabled=self.enabled,
                 http={
-                    "uri": cloud_response.json()["data"]["worker_endpoint"],
+                    "uri": worker_endpoint,
                     "secret": self.secret.value,
                     "timeout": self.timeout,
                     "retry": self.retries,
@@ -150,7 +214,7 @@ class Request(BaseModel):
                 id=self.name,
                 enabled=self.enabled,
                 http={
-                    "uri": cloud_response.json()["data"]["worker_endpoint"],
+                    "uri": worker_endpoint,
                     "secret": self.secret.value,
                     "timeout": self.timeout,
                     "retry": self.retries,
@@ -160,7 +224,7 @@ class Request(BaseModel):
         except Exception as e:
             raise ValueError(f"Failed to add worker to engine: {e}")
 
-        return cloud_response.json()
+        return cloud_data
 
 
 class Worker(BaseModel):
@@ -173,10 +237,11 @@ class Worker(BaseModel):
     def request(self) -> Request:
         """Convert Deployment to a Request object."""
         self.validate_packages()
-        self.compress_local_packages()
         if self.config.secret is None:
             raise ValueError("Secret is required")
-        return Request(
+        # Every field was validated when the Worker was parsed, and the local packages
+        # are built here, so skip re-validating them
+        return Request.model_construct(
             name=self.config.id,
             secret=self.config.secret,
             enabled=self.config.enabled,
@@ -193,13 +258,19 @@ class Worker(BaseModel):
         if self.local_source is None:
             return None
 
+        # Local package paths are relative to the deployment file
+        deployment_dir = self.toml_path.parent
+
         # Compress local packages into a list of LocalPackage objects
         def process_package(package_path_str: str) -> LocalPackage:
-            package_path = self.toml_path.parent / package_path_str
+            package_path = deployment_dir / package_path_str
 
-            if not package_path.exists():
+            # One stat() answers both "exists" and "is a directory"
+            try:
+                package_mode = package_path.stat().st_mode
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Local package not found: {package_path}")
-            if not package_path.is_dir():
+            if not stat.S_ISDIR(package_mode):
                 raise FileNotFoundError(f"Local package is not a directory: {package_path}")
 
             # Check that the package is a valid python package
@@ -213,16 +284,23 @@ class Worker(BaseModel):
 
             # Compress the package into a byte stream and tar
             byte_stream = io.BytesIO()
-            with tarfile.open(fileobj=byte_stream, mode="w:gz") as tar:
-                tar.add(package_path, arcname=package_path.name)
+            with tarfile.open(
+                fileobj=byte_stream, mode="w:gz", compresslevel=PACKAGE_COMPRESS_LEVEL
+            ) as tar:
+                tar.add(package_path, arcname=package_path.name, filter=_exclude_build_artifacts)
 
-            byte_stream.seek(0)
-            package_bytes = byte_stream.read()
-            package_bytes_b64 = base64.b64encode(package_bytes).decode("utf-8")
+            # Encode straight from the buffer instead of reading a copy of it back out
+            package_bytes_b64 = base64.b64encode(byte_stream.getbuffer()).decode("ascii")
 
             return LocalPackage(name=package_path.name, content=package_bytes_b64)
 
-        return list(map(process_package, self.local_source.packages))
+        packages = self.local_source.packages
+        if len(packages) <= 1:
+            return list(map(process_package, packages))
+
+        # zlib and base64 release the GIL, so packages compress in parallel on threads
+        with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+            return list(executor.map(process_package, packages))
 
     # Validate that there are no duplicate packages for each worker
     def validate_packages(self) -> None:
@@ -237,8 +315,8 @@ class Worker(BaseModel):
                     packages.append(package.name)
         if self.local_source:
             for local_package in self.local_source.packages:
-                packages.append(os.path.normpath(Path(local_package)))
-        dupes = [x for n, x in enumerate(packages) if x in packages[:n]]
+                packages.append(os.path.normpath(local_package))
+        dupes = [name for name, count in Counter(packages).items() if count > 1]
         if dupes:
             raise ValueError(f"Duplicate packages: {dupes}")
 
@@ -250,17 +328,18 @@ class Deployment(BaseModel):
     # Validate that there are no duplicate worker names
     @model_validator(mode="after")
     def validate_workers(self) -> "Deployment":
-        for worker in self.worker:
-            if sum(worker.config.id == w.config.id for w in self.worker) > 1:
-                raise ValueError(f"Duplicate worker name: {worker.config.id}")
+        counts = Counter(worker.config.id for worker in self.worker)
+        # Counter keeps insertion order, so this reports the first repeated name
+        for worker_id, count in counts.items():
+            if count > 1:
+                raise ValueError(f"Duplicate worker name: {worker_id}")
         return self
 
     # Load a deployment from a toml file
     @classmethod
     def from_toml(cls, toml_path: Path) -> "Deployment":
         try:
-            with open(toml_path) as f:
-                toml_data = toml.load(f)
+            toml_data = load_toml(toml_path)
 
             if not toml_data:
                 raise ValueError(f"Empty TOML file: {toml_path}")
@@ -272,7 +351,7 @@ class Deployment(BaseModel):
 
             return cls(**toml_data, toml_path=toml_path)
 
-        except toml.TomlDecodeError as e:
+        except TomlDecodeError as e:
             raise ValueError(f"Invalid TOML format in {toml_path}: {e!s}")
         except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {toml_path}")
@@ -332,7 +411,7 @@ def get_env_secret(secret: str) -> Secret:
     if matches and len(matches) == 1:
         match = matches[0].strip()
         # Attempt to lookup and create the secret
-        print(f"Looking up secret: {match}")
+        logger.debug("Looking up secret: %s", match)
         value = os.getenv(match)
         if value:
             return Secret(value=value, pattern=match)
@@ -83,7 +83,7 @@ class BaseWorker(Worker):
         """
         Get the catalog as a list of ToolDefinitions.
         """
-        return [tool.definition for tool in self.catalog]
+        return self.catalog.get_tool_definitions()
 
     def register_tool(self, tool: Callable, toolkit_name: str) -> None:
         """
@@ -126,7 +126,8 @@ class BaseWorker(Worker):
         logger.info(
             f"{execution_id} | Calling tool: {tool_fqname} version: {tool_request.tool.version}"
         )
-        logger.debug(f"{execution_id} | Tool inputs: {tool_request.inputs}")
+        # Inputs and outputs can be large: only format them when debug logging is on
+        logger.debug("%s | Tool inputs: %s", execution_id, tool_request.inputs)
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span("RunTool"):
@@ -151,22 +152,22 @@ class BaseWorker(Worker):
                 f"{execution_id} | Tool developer message: {output.error.developer_message}"
             )
             logger.debug(
-                f"{execution_id} | duration: {duration_ms}ms | Tool output: {output.value}"
+                "%s | duration: %sms | Tool output: %s", execution_id, duration_ms, output.value
             )
             if output.error.traceback_info:
-                logger.debug(f"{execution_id} | Tool traceback: {output.error.traceback_info}")
+                logger.debug("%s | Tool traceback: %s", execution_id, output.error.traceback_info)
         else:
             logger.info(
                 f"{execution_id} | Tool {tool_fqname} version {tool_request.tool.version} success"
             )
             logger.debug(
-                f"{execution_id} | duration: {duration_ms}ms | Tool output: {output.value}"
+                "%s | duration: %sms | Tool output: %s", execution_id, duration_ms, output.value
             )
 
         return ToolCallResponse(
             execution_id=execution_id,
             duration=duration_ms,
-            finished_at=datetime.now().isoformat(),
+            finished_at=datetime.fromtimestamp(end_time).isoformat(),
             success=not output.error,
             output=output,
         )
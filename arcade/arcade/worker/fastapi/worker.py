@@ -1,7 +1,7 @@
-import json
 from typing import Any, Callable
 
-from fastapi import Depends, FastAPI, Request
+import pydantic_core
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from opentelemetry.metrics import Meter
 
@@ -44,6 +44,19 @@ class FastAPIRouter(Router):
     def __init__(self, app: FastAPI, worker: BaseWorker) -> None:
         self.app = app
         self.worker = worker
+        # The last list response and its JSON encoding, see _encode_list
+        self._encoded_list: tuple[list, bytes] | None = None
+
+    def _encode_list(self, result: list) -> Response:
+        """
+        Encode a list response (the tool catalog) with pydantic's serializer.
+
+        The worker returns the same catalog list until a tool is added, so the encoded
+        bytes are reused for as long as the handler keeps returning that list.
+        """
+        if self._encoded_list is None or self._encoded_list[0] is not result:
+            self._encoded_list = (result, pydantic_core.to_json(result))
+        return Response(content=self._encoded_list[1], media_type="application/json")
 
     def _wrap_handler(self, handler: Callable, require_auth: bool = True) -> Callable:
         """
@@ -67,16 +80,20 @@ class FastAPIRouter(Router):
             else None,
         ) -> Any:
             body_str = await request.body()
-            body_json = json.loads(body_str) if body_str else {}
+            # pydantic-core's JSON parser is about twice as fast as json.loads on tool calls
+            body_json = pydantic_core.from_json(body_str) if body_str else {}
             request_data = RequestData(
                 path=request.url.path,
                 method=request.method,
                 body_json=body_json,
             )
             if is_async_callable(handler):
-                return await handler(request_data)
+                result = await handler(request_data)
             else:
-                return handler(request_data)
+                result = handler(request_data)
+            if isinstance(result, list):
+                return self._encode_list(result)
+            return result
 
         return wrapped_handler
 
@@ -1,10 +1,14 @@
+from typing import Annotated
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
+from pydantic.errors import PydanticSchemaGenerationError
 
+from arcade.core import catalog as catalog_module
 from arcade.core.catalog import ToolCatalog
 from arcade.core.errors import ToolDefinitionError
-from arcade.core.schema import FullyQualifiedName
+from arcade.core.schema import FullyQualifiedName, ValueSchema
 from arcade.core.toolkit import Toolkit
 from arcade.sdk import tool
 
@@ -47,6 +51,91 @@ def test_add_tool_with_toolkit():
     )
 
 
+def test_get_tool_names():
+    catalog = ToolCatalog()
+    toolkit = Toolkit(
+        name="sample_toolkit",
+        description="A sample toolkit",
+        version="1.0.0",
+        package_name="sample_toolkit",
+    )
+    catalog.add_tool(sample_tool, toolkit)
+    assert catalog.get_tool_names() == [FullyQualifiedName("SampleTool", "SampleToolkit", "1.0.0")]
+
+
+def test_tool_signature_is_introspected_once():
+    catalog = ToolCatalog()
+    ToolCatalog.clear_cache()
+    with patch.object(
+        catalog_module.inspect, "signature", wraps=catalog_module.inspect.signature
+    ) as signature:
+        catalog.add_tool(sample_tool, "sample_toolkit")
+        catalog.add_tool(sample_tool, "other_toolkit")
+    assert signature.call_count == 1
+
+
+def test_tool_definition_is_memoized():
+    ToolCatalog.clear_cache()
+    first = ToolCatalog.create_tool_definition(sample_tool, "sample_toolkit", "1.0.0")
+    assert ToolCatalog.create_tool_definition(sample_tool, "sample_toolkit", "1.0.0") is first
+    assert catalog_module.create_func_models(sample_tool) is catalog_module.create_func_models(
+        sample_tool
+    )
+
+    # Other toolkits and versions reuse the tool's input and output definitions
+    other = ToolCatalog.create_tool_definition(sample_tool, "other_toolkit", "2.0.0")
+    assert other is not first
+    assert other.input is first.input
+    assert other.output is first.output
+
+    ToolCatalog.clear_cache()
+    assert ToolCatalog.create_tool_definition(sample_tool, "sample_toolkit", "1.0.0") is not first
+
+
+class PlainValue:
+    pass
+
+
+@tool
+def tool_with_unsupported_type(
+    values: Annotated[dict[str, PlainValue], "Values keyed by name"],
+) -> str:
+    """A tool whose input pydantic cannot build a model for"""
+    return ""
+
+
+def test_add_tool_builds_models():
+    catalog = ToolCatalog()
+    catalog.add_tool(sample_tool, "sample_toolkit")
+
+    tool = catalog.get_tool_by_name("SampleTool")
+    assert tool.input_model.__name__ == "SampleToolInput"
+    assert tool.output_model.__name__ == "SampleToolOutput"
+
+
+def test_add_tool_with_unsupported_type_raises():
+    catalog = ToolCatalog()
+    with pytest.raises(PydanticSchemaGenerationError):
+        catalog.add_tool(tool_with_unsupported_type, "sample_toolkit")
+    assert len(catalog) == 0
+
+
+def test_get_tool_definitions():
+    catalog = ToolCatalog()
+    assert catalog.get_tool_definitions() == []
+
+    catalog.add_tool(sample_tool, "sample_toolkit")
+    definitions = catalog.get_tool_definitions()
+    assert [d.name for d in definitions] == ["SampleTool"]
+    assert catalog.get_tool_definitions() is definitions
+
+    catalog.add_tool(sample_tool, "other_toolkit")
+    assert [d.toolkit.name for d in catalog.get_tool_definitions()] == [
+        "SampleToolkit",
+        "OtherToolkit",
+    ]
+
+
 @pytest.mark.parametrize(
     "toolkit_version, expected_tool",
     [
@@ -71,6 +160,23 @@ def test_get_tool(toolkit_version: str | None, expected_tool):
     assert tool.tool == expected_tool
 
 
+def test_get_tool_without_version_returns_first_added():
+    catalog = ToolCatalog()
+    for version in ("1.0.0", "2.0.0"):
+        toolkit = Toolkit(
+            name="sample_toolkit",
+            description="A sample toolkit",
+            version=version,
+            package_name="sample_toolkit",
+        )
+        catalog.add_tool(sample_tool, toolkit)
+
+    tool = catalog.get_tool(FullyQualifiedName("sampletool", "sampletoolkit", None))
+    assert tool.definition.toolkit.version == "1.0.0"
+    with pytest.raises(ValueError):
+        catalog.get_tool(FullyQualifiedName("OtherTool", "SampleToolkit", None))
+
+
 def test_add_toolkit_type_error():
     catalog = ToolCatalog()
 
@@ -191,3 +297,55 @@ def test_add_tool_with_disabled_toolkit(monkeypatch):
         )
     )
     assert len(catalog._tools) == 0
+
+
+def test_output_models_are_shared_between_equal_return_types():
+    def make_tool():
+        def get_greeting(name: Annotated[str, "The name to greet"]) -> list[str]:
+            return [name]
+
+        return get_greeting
+
+    first, second = make_tool(), make_tool()
+    assert catalog_module.determine_output_model(first) is catalog_module.determine_output_model(
+        second
+    )
+    assert (
+        catalog_module.determine_output_model(first).model_fields["result"].annotation == list[str]
+    )
+
+
+def test_value_schemas_are_shared_between_equal_types():
+    def greet(
+        name: Annotated[str, "The name to greet"], title: Annotated[str, "The title to use"]
+    ) -> Annotated[str, "The greeting"]:
+        return f"{title} {name}"
+
+    inputs = catalog_module.create_input_definition(greet)
+    output = catalog_module.create_output_definition(greet)
+    first, second = (param.value_schema for param in inputs.parameters)
+    assert first is second is output.value_schema
+    assert first == ValueSchema(val_type="string", inner_val_type=None, enum=None)
+
+
+def test_input_models_are_shared_between_equal_signatures():
+    def make_tool(default):
+        def greet(name: Annotated[str, "The name to greet"] = default) -> str:
+            return name
+
+        return greet
+
+    first, second, other = make_tool("you"), make_tool("you"), make_tool("me")
+    first_input, _ = catalog_module.create_func_models(first)
+    assert catalog_module.create_func_models(second)[0] is first_input
+    assert catalog_module.create_func_models(other)[0] is not first_input
+    assert first_input.model_fields["name"].default == "you"
+
+
+def test_shared_value_schemas_are_frozen():
+    def greet(name: Annotated[str, "The name to greet"]) -> str:
+        return name
+
+    value_schema = catalog_module.create_input_definition(greet).parameters[0].value_schema
+    with pytest.raises(ValidationError):
+        value_schema.val_type = "integer"
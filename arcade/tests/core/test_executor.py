@@ -1,6 +1,7 @@
 from typing import Annotated
 
 import pytest
+from pydantic import BaseModel
 
 from arcade.core.catalog import ToolCatalog
 from arcade.core.executor import ToolExecutor
@@ -15,6 +16,23 @@ def simple_tool(inp: Annotated[str, "input"]) -> Annotated[str, "output"]:
     return inp
 
 
+@tool
+async def simple_async_tool(inp: Annotated[str, "input"]) -> Annotated[str, "output"]:
+    """Simple async tool"""
+    return inp
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+@tool
+def nested_model_tool(point: Annotated[Point, "point"]) -> Annotated[str, "output"]:
+    """Simple tool that takes a nested model, which is passed as a dict"""
+    return f"{type(point).__name__} {point['x']},{point['y']}"
+
+
 @tool.deprecated("Use simple_tool instead")
 @tool
 def simple_deprecated_tool(inp: Annotated[str, "input"]) -> Annotated[str, "output"]:
@@ -50,7 +68,9 @@ def bad_output_error_tool() -> Annotated[str, "output"]:
 
 catalog = ToolCatalog()
 catalog.add_tool(simple_tool, "simple_toolkit")
+catalog.add_tool(simple_async_tool, "simple_toolkit")
 catalog.add_tool(simple_deprecated_tool, "simple_toolkit")
+catalog.add_tool(nested_model_tool, "simple_toolkit")
 catalog.add_tool(retryable_error_tool, "simple_toolkit")
 catalog.add_tool(exec_error_tool, "simple_toolkit")
 catalog.add_tool(unexpected_error_tool, "simple_toolkit")
@@ -62,6 +82,8 @@ catalog.add_tool(bad_output_error_tool, "simple_toolkit")
     "tool_func, inputs, expected_output",
     [
         (simple_tool, {"inp": "test"}, ToolCallOutput(value="test")),
+        (simple_async_tool, {"inp": "test"}, ToolCallOutput(value="test")),
+        (nested_model_tool, {"point": {"x": 1, "y": 2}}, ToolCallOutput(value="dict 1,2")),
         (
             simple_deprecated_tool,
             {"inp": "test"},
@@ -132,6 +154,8 @@ catalog.add_tool(bad_output_error_tool, "simple_toolkit")
     ],
     ids=[
         "simple_tool",
+        "simple_async_tool",
+        "nested_model_tool",
         "simple_deprecated_tool",
         "retryable_error_tool",
         "exec_error_tool",
@@ -1,8 +1,9 @@
 import ast
+from unittest.mock import patch
 
 import pytest
 
-from arcade.core.parse import get_tools_from_ast
+from arcade.core.parse import get_tools_from_ast, get_tools_from_file
 
 
 @pytest.mark.parametrize(
@@ -50,3 +51,16 @@ def test_get_function_name_if_decorated(source, expected_tools):
     tree = ast.parse(source)
     tools = get_tools_from_ast(tree)
     assert tools == expected_tools
+
+
+def test_get_tools_from_file_reparses_changed_files(tmp_path):
+    module = tmp_path / "tools.py"
+    module.write_text("@tool\ndef first():\n    pass\n")
+    assert get_tools_from_file(module) == ["first"]
+
+    with patch("arcade.core.parse.load_ast_tree") as load_ast_tree:
+        assert get_tools_from_file(module) == ["first"]
+    load_ast_tree.assert_not_called()
+
+    module.write_text("@tool\ndef first():\n    pass\n\n\n@tool\ndef second():\n    pass\n")
+    assert get_tools_from_file(module) == ["first", "second"]
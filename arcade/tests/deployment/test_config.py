@@ -1,10 +1,15 @@
 # Ignore hardcoded secret linting
 # ruff: noqa: S105
 # ruff: noqa: S106
+import base64
+import io
 import json
 import os
+import tarfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from arcade.worker.config.deployment import (
@@ -14,6 +19,7 @@ from arcade.worker.config.deployment import (
     Package,
     PackageRepository,
     Pypi,
+    Request,
     Secret,
     Worker,
 )
@@ -132,12 +138,67 @@ def test_deployment_dict(test_dir):
     assert got == expected
 
 
+def test_compress_local_packages(test_dir):
+    config_path = test_dir / "test_files" / "full.worker.toml"
+    worker = Deployment.from_toml(config_path).worker[0]
+
+    (package,) = worker.compress_local_packages()
+    assert package.name == "mock_toolkit"
+    with tarfile.open(fileobj=io.BytesIO(base64.b64decode(package.content)), mode="r:gz") as tar:
+        assert "mock_toolkit/pyproject.toml" in tar.getnames()
+
+
+def test_compress_multiple_local_packages_keeps_order(tmp_path):
+    names = [f"toolkit_{i}" for i in range(4)]
+    for name in names:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+    worker = Worker(
+        toml_path=tmp_path / "worker.toml",
+        config=Config(id="test", secret=Secret(value="test-secret", pattern=None)),
+        local_source=LocalPackages(packages=[f"./{name}" for name in names]),
+    )
+
+    assert [package.name for package in worker.compress_local_packages()] == names
+
+
+def test_compress_local_packages_skips_caches(tmp_path):
+    package = tmp_path / "toolkit"
+    (package / "toolkit" / "__pycache__").mkdir(parents=True)
+    (package / ".git").mkdir()
+    (package / "pyproject.toml").write_text('[project]\nname = "toolkit"\n')
+    (package / "toolkit" / "tools.py").write_text("")
+    (package / "toolkit" / "__pycache__" / "tools.cpython-311.pyc").write_bytes(b"")
+    (package / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    worker = Worker(
+        toml_path=tmp_path / "worker.toml",
+        config=Config(id="test", secret=Secret(value="test-secret", pattern=None)),
+        local_source=LocalPackages(packages=["./toolkit"]),
+    )
+
+    (compressed,) = worker.compress_local_packages()
+    content = io.BytesIO(base64.b64decode(compressed.content))
+    with tarfile.open(fileobj=content, mode="r:gz") as tar:
+        assert sorted(tar.getnames()) == [
+            "toolkit",
+            "toolkit/pyproject.toml",
+            "toolkit/toolkit",
+            "toolkit/toolkit/tools.py",
+        ]
+
+
 def test_invalid_secret_parsing(test_dir):
     config_path = test_dir / "test_files" / "invalid.secret.worker.toml"
     with pytest.raises(ValueError):
         Deployment.from_toml(config_path)
 
 
+@pytest.mark.parametrize("secret", ["", "   ", "dev"])
+def test_rejected_secrets(secret):
+    with pytest.raises(ValueError):
+        Config(id="test", secret=secret)
+
+
 def test_missing_local_package(test_dir):
     config_path = test_dir / "test_files" / "invalid.localfile.worker.toml"
     deployment = Deployment.from_toml(config_path)
@@ -228,9 +289,41 @@ def test_duplicate_worker_names():
         Deployment(workers=[worker, worker2])
 
 
+def test_duplicate_names_are_reported_once():
+    worker = Worker(
+        toml_path=Path(__file__),
+        config=Config(id="test", secret=Secret(value="test-secret", pattern=None)),
+        pypi_source=Pypi(packages=["arcade-slack", "arcade-slack", "arcade-slack"]),
+    )
+    with pytest.raises(ValueError, match=r"Duplicate packages: \['arcade-slack'\]$"):
+        worker.validate_packages()
+    with pytest.raises(ValueError, match="Duplicate worker name: test"):
+        Deployment(toml_path=Path(__file__), worker=[worker, worker.model_copy()])
+
+
 def test_secret_parsing(test_dir):
     os.environ["TEST_WORKER_SECRET"] = "test-secret"
     deployment = Deployment.from_toml(test_dir / "test_files" / "env.secret.worker.toml")
     assert deployment.worker[0].config.secret == Secret(
         value="test-secret", pattern="TEST_WORKER_SECRET"
     )
+
+
+def test_request_execute_url():
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"data": {"worker_endpoint": "https://worker"}})
+
+    cloud_client = httpx.Client(
+        base_url="https://cloud.example.com", transport=httpx.MockTransport(handler)
+    )
+    request = Request(
+        name="test", secret=Secret(value="test-secret"), enabled=True, timeout=10, retries=1
+    )
+    request.execute(cloud_client, MagicMock())
+
+    assert len(sent) == 1
+    assert sent[0].method == "PUT"
+    assert str(sent[0].url) == "https://cloud.example.com/api/v1/workers"
@@ -1,6 +1,11 @@
+import asyncio
+import itertools
+import logging
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
+import scipy.optimize
 
 from arcade.sdk import tool
 from arcade.sdk.eval import (
@@ -9,9 +14,21 @@ from arcade.sdk.eval import (
     ExpectedToolCall,
     NamedExpectedToolCall,
     NoneCritic,
+    NumericCritic,
     SimilarityCritic,
 )
-from arcade.sdk.eval.eval import EvalCase, EvalSuite, EvaluationResult
+from arcade.sdk.eval import eval as eval_module
+from arcade.sdk.eval.eval import (
+    EvalCase,
+    EvalSuite,
+    EvaluationResult,
+    batch_critic_scores,
+    compare_tool_name,
+    get_tool_args,
+    name_bucket_assignment,
+    sparse_assignment,
+    tool_name_match_matrix,
+)
 
 
 @tool
@@ -58,6 +75,44 @@ def test_evaluation_result_accumulation():
     assert evaluation.score == expected_score
 
 
+# Test that EvaluationResult.results is a plain list of critic result dicts
+def test_evaluation_result_results():
+    prior = {"field": "prior", "match": True, "score": 1.0}
+    evaluation = EvaluationResult(results=[prior])
+    evaluation.results.append(prior)
+    assert evaluation.results == [prior, prior]
+
+    evaluation = EvaluationResult()
+    evaluation.score_tool_selection("ToolA", "Tool_A", 1.0)
+    evaluation.add(
+        field="field1",
+        result={"match": None, "score": 0.0, "is_criticized": False},
+        weight=0.0,
+        expected="expected_value",
+        actual=None,
+    )
+
+    assert evaluation.results == [
+        {
+            "field": "tool_selection",
+            "match": False,
+            "score": 0.0,
+            "weight": 1.0,
+            "expected": "ToolA",
+            "actual": "Tool_A",
+        },
+        {
+            "field": "field1",
+            "match": None,
+            "score": 0.0,
+            "is_criticized": False,
+            "weight": 0.0,
+            "expected": "expected_value",
+            "actual": None,
+        },
+    ]
+
+
 # Test EvalCase.evaluate()
 def test_eval_case_evaluate():
     """
@@ -139,6 +194,82 @@ def test_eval_case_evaluate_mismatched_tools():
     assert result.passed is False
 
 
+# Test that a single expected and actual tool call skip the assignment solver
+def test_eval_case_single_tool_call_skips_assignment(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("linear_sum_assignment should not be called")
+
+    monkeypatch.setattr(scipy.optimize, "linear_sum_assignment", fail)
+
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[NamedExpectedToolCall(name="ToolA", args={"param": "value"})],
+        critics=[BinaryCritic(critic_field="param", weight=1.0)],
+    )
+
+    result = case.evaluate([("ToolA", {"param": "value"})])
+
+    assert result.score == 1.0
+    assert result.passed
+
+
+# Test that in-order tool calls with distinct names skip the assignment solver
+def test_eval_case_identity_assignment(monkeypatch):
+    expected_tool_calls = [
+        NamedExpectedToolCall(name="ToolA", args={"param": "a"}),
+        NamedExpectedToolCall(name="ToolB", args={"param": "b"}),
+    ]
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=expected_tool_calls,
+        critics=[BinaryCritic(critic_field="param", weight=1.0)],
+    )
+
+    assert case._is_identity_assignment_optimal([("ToolA", {}), ("toolb", {})])
+    assert not case._is_identity_assignment_optimal([("ToolB", {}), ("ToolA", {})])
+
+    repeated = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[expected_tool_calls[0], expected_tool_calls[0]],
+        critics=[BinaryCritic(critic_field="param", weight=1.0)],
+    )
+    assert not repeated._is_identity_assignment_optimal([("ToolA", {}), ("ToolA", {})])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("linear_sum_assignment should not be called")
+
+    monkeypatch.setattr(scipy.optimize, "linear_sum_assignment", fail)
+    result = case.evaluate([("ToolA", {"param": "a"}), ("ToolB", {"param": "wrong"})])
+    assert result.score == pytest.approx(3.0 / 4.0)
+
+
+# Test that critics scoring outside [0, weight] don't take the identity shortcut
+def test_eval_case_identity_assignment_unbounded_critic():
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[
+            NamedExpectedToolCall(name="ToolA", args={"x": 0}),
+            NamedExpectedToolCall(name="ToolB", args={"x": 1000}),
+        ],
+        critics=[NumericCritic(critic_field="x", weight=0.5, value_range=(0, 10))],
+        rubric=EvalRubric(fail_on_tool_selection=False),
+    )
+    actual_tool_calls = [("ToolA", {"x": 1000}), ("ToolB", {"x": 0})]
+
+    assert not case._is_identity_assignment_optimal(actual_tool_calls)
+    # The swapped pairing loses both tool selections but avoids two scores of -49.5
+    result = case.evaluate(actual_tool_calls)
+    assert result.score == pytest.approx(1.0 / 3.0)
+
+
 # Test EvalCase with multiple critics and weights
 def test_eval_case_multiple_critics():
     """
@@ -206,6 +337,244 @@ def test_eval_case_with_none_values():
     assert result.score == 2.0 / 2.0  # Full score (tool selection + critic score)
 
 
+# Test that the vectorized tool name comparison matches compare_tool_name
+def test_tool_name_match_matrix_matches_compare_tool_name():
+    expected_tool_calls = [
+        NamedExpectedToolCall(name="Google.ListEmails", args={}),
+        NamedExpectedToolCall(name="Google_SendEmail", args={}),
+    ]
+    actual_tool_calls = [("google-listemails", {}), ("Google.SendEmail", {}), ("Other", {})]
+
+    name_match = tool_name_match_matrix(expected_tool_calls, actual_tool_calls)
+
+    assert name_match.shape == (2, 3)
+    for i, expected in enumerate(expected_tool_calls):
+        for j, (actual_name, _) in enumerate(actual_tool_calls):
+            assert name_match[i, j] == compare_tool_name(expected.name, actual_name)
+    assert tool_name_match_matrix([], actual_tool_calls).shape == (0, 3)
+
+
+# Test that name-bucket assignment scores as well as the assignment solver
+def test_name_bucket_assignment_matches_linear_sum_assignment():
+    names = ["ToolA", "Tool_A", "ToolB"]
+    name_lists = [list(p) for size in range(1, 4) for p in itertools.product(names, repeat=size)]
+    for expected_names, actual_names in itertools.product(name_lists, repeat=2):
+        expected_tool_calls = [NamedExpectedToolCall(name=name, args={}) for name in expected_names]
+        actual_tool_calls = [(name, {}) for name in actual_names]
+
+        name_match = tool_name_match_matrix(expected_tool_calls, actual_tool_calls)
+        row_ind, col_ind = scipy.optimize.linear_sum_assignment(name_match, maximize=True)
+        assignment = name_bucket_assignment(expected_tool_calls, actual_tool_calls)
+
+        assert len(assignment) == len(row_ind)
+        assert len({i for i, _ in assignment}) == len({j for _, j in assignment}) == len(row_ind)
+        assert sum(name_match[i, j] for i, j in assignment) == name_match[row_ind, col_ind].sum()
+
+
+# Test that sparse assignment scores as well as the dense assignment solver
+def test_sparse_assignment_matches_linear_sum_assignment():
+    rng = np.random.default_rng(0)
+    for n in (1, 5, 40):
+        for _ in range(10):
+            cost_matrix = np.where(rng.random((n, n)) < 0.1, rng.random((n, n)), 0.0)
+
+            assignment = sparse_assignment(cost_matrix)
+            row_ind, col_ind = scipy.optimize.linear_sum_assignment(cost_matrix, maximize=True)
+
+            assert sorted(i for i, _ in assignment) == list(range(n))
+            assert sorted(j for _, j in assignment) == list(range(n))
+            assert sum(cost_matrix[i, j] for i, j in assignment) == pytest.approx(
+                cost_matrix[row_ind, col_ind].sum()
+            )
+
+
+# Test that get_tool_args parses each tool call into its own arguments dict
+def test_get_tool_args():
+    def completion(*tool_calls):
+        message = Mock(tool_calls=list(tool_calls))
+        return Mock(choices=[Mock(message=message)])
+
+    def tool_call(name, arguments):
+        function = Mock(arguments=arguments)
+        function.name = name
+        return Mock(function=function)
+
+    assert get_tool_args(completion()) == []
+
+    tool_args = get_tool_args(
+        completion(
+            tool_call("Google_ListEmails", '{"n": 5, "labels": ["inbox"]}'),
+            tool_call("Google_ListEmails", '{"n": 5, "labels": ["inbox"]}'),
+            tool_call("Google_SendEmail", '{"to": "a"}'),
+            tool_call("Google_SendEmail", "null"),
+        )
+    )
+    assert tool_args == [
+        ("Google.ListEmails", {"n": 5, "labels": ["inbox"]}),
+        ("Google.ListEmails", {"n": 5, "labels": ["inbox"]}),
+        ("Google.SendEmail", {"to": "a"}),
+        ("Google.SendEmail", None),
+    ]
+    assert tool_args[0][1] is not tool_args[1][1]
+    assert tool_args[0][1]["labels"] is not tool_args[1][1]["labels"]
+
+
+# Test that assigned pairs reuse the critic results from the cost matrix
+def test_eval_case_reuses_cost_matrix_critic_results(monkeypatch):
+    """
+    Test that critics are evaluated once per (expected, actual) pair, not again
+    for the assigned pairs after the assignment is solved.
+    """
+    expected_tool_calls = [
+        NamedExpectedToolCall(name="ToolA", args={"param": "a"}),
+        NamedExpectedToolCall(name="ToolA", args={"param": "b"}),
+    ]
+    actual_tool_calls = [("ToolA", {"param": "b"}), ("ToolA", {"param": "a"})]
+
+    critic = BinaryCritic(critic_field="param", weight=1.0)
+    evaluate = Mock(wraps=critic.evaluate)
+    monkeypatch.setattr(critic, "evaluate", evaluate)
+
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=expected_tool_calls,
+        critics=[critic],
+    )
+
+    result = case.evaluate(actual_tool_calls)
+
+    assert result.score == 1.0
+    assert evaluate.call_count == 4
+
+
+# Test that a failing critic is logged and scores zero
+def test_eval_case_logs_failing_critic(caplog):
+    critic = NumericCritic(critic_field="param", weight=1.0, value_range=(0, 10))
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[NamedExpectedToolCall(name="ToolA", args={"param": 5})],
+        critics=[critic],
+    )
+
+    with caplog.at_level(logging.WARNING, logger="arcade.sdk.eval.eval"):
+        result = case.evaluate([("ToolA", {"param": "five"})])
+
+    assert result.results[-1]["score"] == 0.0
+    assert "Critic evaluation failed for field 'param'" in caplog.text
+
+
+# Test that repeated argument values are evaluated once per critic in large matrices
+def test_eval_case_memoizes_repeated_critic_inputs(monkeypatch):
+    monkeypatch.setattr(eval_module, "VECTORIZED_COST_MATRIX_MIN_CELLS", 0)
+    critic = BinaryCritic(critic_field="param", weight=1.0)
+    evaluate = Mock(wraps=critic.evaluate)
+    monkeypatch.setattr(critic, "evaluate", evaluate)
+
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[
+            NamedExpectedToolCall(name="ToolA", args={"param": "a"}),
+            NamedExpectedToolCall(name="ToolA", args={"param": "a"}),
+        ],
+        critics=[critic],
+    )
+
+    result = case.evaluate([("ToolA", {"param": "a"}), ("ToolA", {"param": "a"})])
+
+    assert result.score == 1.0
+    assert evaluate.call_count == 1
+
+    # Unhashable values are evaluated for every cell
+    evaluate.reset_mock()
+    case.evaluate([("ToolA", {"param": ["a"]}), ("ToolA", {"param": ["a"]})])
+    assert evaluate.call_count == 4
+
+
+# Test that batch critic scores match per-cell critic evaluation
+def test_batch_critic_scores_match_evaluate():
+    expected_values = [10, 90, None]
+    actual_values = [80, "15", None]
+    critic = NumericCritic(critic_field="x", weight=0.5, value_range=(0, 100))
+
+    scores = batch_critic_scores(critic, expected_values, actual_values)
+
+    assert scores is not None
+    assert scores.shape == (3, 3)
+    for i, expected in enumerate(expected_values):
+        for j, actual in enumerate(actual_values):
+            if expected is None or actual is None:
+                assert scores[i, j] == 0.0
+            else:
+                assert scores[i, j] == pytest.approx(critic.evaluate(expected, actual)["score"])
+
+    # Critics without a batch implementation, and non-numeric values, are not batched
+    assert batch_critic_scores(BinaryCritic(critic_field="x", weight=0.5), [1], []) is None
+    assert batch_critic_scores(critic, ["ten"], [10]) is None
+
+
+# Test that the per-cell and vectorized cost matrices agree for batched and per-cell critics
+def test_eval_case_cost_matrix_loop_matches_vectorized(monkeypatch):
+    expected_tool_calls = [
+        NamedExpectedToolCall(name="ToolA", args={"x": 10, "note": "a"}),
+        NamedExpectedToolCall(name="ToolB", args={"x": 90, "note": "b"}),
+    ]
+    actual_tool_calls = [
+        ("ToolB", {"x": 80, "note": "b"}),
+        ("ToolA", {"x": 15, "note": "c"}),
+        ("ToolA", {"x": None, "note": "a"}),
+    ]
+
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=expected_tool_calls,
+        critics=[
+            NumericCritic(critic_field="x", weight=0.6, value_range=(0, 100)),
+            BinaryCritic(critic_field="note", weight=0.4),
+        ],
+    )
+
+    loop_matrix = case._create_cost_matrix(actual_tool_calls, expected_tool_calls)
+
+    monkeypatch.setattr(eval_module, "VECTORIZED_COST_MATRIX_MIN_CELLS", 0)
+    vectorized_matrix = case._create_cost_matrix(actual_tool_calls, expected_tool_calls)
+
+    assert loop_matrix.shape == (3, 3)
+    assert loop_matrix == pytest.approx(vectorized_matrix)
+    assert loop_matrix[0, 1] == pytest.approx(1.0 + 0.6 * 0.95)
+
+
+# Test that a critic overriding evaluate is not scored by its parent's fast paths
+def test_critic_subclass_overriding_evaluate_skips_fast_paths(monkeypatch):
+    class ExactNumericCritic(NumericCritic):
+        def evaluate(self, expected, actual):
+            match = float(expected) == float(actual)
+            return {"match": match, "score": self.weight if match else 0.0}
+
+    critic = ExactNumericCritic(critic_field="x", weight=0.5, value_range=(0, 100))
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[NamedExpectedToolCall(name="ToolA", args={"x": 10})],
+        critics=[critic],
+    )
+    monkeypatch.setattr(eval_module, "VECTORIZED_COST_MATRIX_MIN_CELLS", 0)
+
+    assert batch_critic_scores(critic, [10], [20]) is None
+    cost_matrix = case._create_cost_matrix(
+        [("ToolA", {"x": 20}), ("ToolA", {"x": 10})], case.expected_tool_calls
+    )
+    assert cost_matrix[0, :2] == pytest.approx([1.0, 1.5])
+
+
 # Test EvalSuite.add_case()
 def test_eval_suite_add_case():
     """
@@ -247,6 +616,35 @@ def test_eval_suite_add_case():
     )
 
 
+@pytest.mark.asyncio
+async def test_eval_suite_iter_run_yields_results_in_case_order():
+    """
+    Test that iter_run yields case results in case order, even when later cases
+    finish first.
+    """
+    mock_catalog = Mock()
+    mock_catalog.get_tool_names.return_value = []
+
+    suite = EvalSuite(name="TestSuite", system_message="System message", catalog=mock_catalog)
+    for i in range(3):
+        suite.add_case(name=f"Case{i}", user_message=f"Message {i}", expected_tool_calls=[])
+
+    async def create(**kwargs):
+        # Earlier cases answer last
+        await asyncio.sleep(0.01 * (3 - int(kwargs["messages"][-1]["content"][-1])))
+        message = Mock(tool_calls=[])
+        return Mock(choices=[Mock(message=message)])
+
+    client = Mock()
+    client.chat.completions.create = create
+
+    names = [result["name"] async for result in suite.iter_run(client, "model")]
+    assert names == ["Case0", "Case1", "Case2"]
+
+    results = await suite.run(client, "model")
+    assert [case["name"] for case in results["cases"]] == names
+
+
 # Test EvalSuite.extend_case()
 def test_eval_suite_extend_case():
     """
@@ -327,3 +327,6 @@ def test_create_tool_def_from_pydantic(func_under_test, expected_tool_def_fields
 
     for field, expected_value in expected_tool_def_fields.items():
         assert getattr(tool_def, field) == expected_value
+
+    # Definitions are memoized per tool and toolkit, including Field()-described params
+    assert ToolCatalog.create_tool_definition(func_under_test, "1.0") is tool_def
@@ -343,9 +343,14 @@ async def list_draft_emails(
     """
     Lists draft emails in the user's draft mailbox using the Gmail API.
     """
+    if n_drafts <= 0:
+        return {"emails": []}
+
     service = _build_gmail_service(context)
 
-    listed_drafts = service.users().drafts().list(userId="me").execute()
+    listed_drafts = (
+        service.users().drafts().list(userId="me", maxResults=min(n_drafts, 500)).execute()
+    )
 
     if not listed_drafts:
         return {"emails": []}
@@ -446,9 +451,18 @@ async def list_emails(
     """
     Read emails from a Gmail account and extract plain text content.
     """
+    if n_emails <= 0:
+        return {"emails": []}
+
     service = _build_gmail_service(context)
 
-    messages = service.users().messages().list(userId="me").execute().get("messages", [])
+    messages = (
+        service.users()
+        .messages()
+        .list(userId="me", maxResults=min(n_emails, 500))
+        .execute()
+        .get("messages", [])
+    )
 
     if not messages:
         return {"emails": []}
@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 from base64 import urlsafe_b64decode, urlsafe_b64encode
@@ -12,7 +13,8 @@ from arcade.sdk import ToolContext
 from arcade.sdk.errors import RetryableToolError, ToolExecutionError
 from bs4 import BeautifulSoup
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import Resource, build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import Resource, build, build_from_document
 
 from arcade_google.constants import (
     DEFAULT_SEARCH_CONTACTS_LIMIT,
@@ -49,6 +51,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def parse_datetime(datetime_str: str, time_zone: str) -> datetime:
     """
@@ -340,7 +344,22 @@ def _build_gmail_service(context: ToolContext) -> Any:
     except Exception as e:
         raise GoogleServiceError(message="Failed to build Gmail service.", developer_message=str(e))
 
-    return build("gmail", "v1", credentials=credentials)
+    document = _gmail_discovery_document()
+    if document is None:
+        return build("gmail", "v1", credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+
+@functools.cache
+def _gmail_discovery_document() -> str | None:
+    """
+    Read the Gmail discovery document bundled with google-api-python-client once.
+
+    Only this public document is cached; credentials and clients are built per call.
+    Returns None if the installed client library doesn't bundle it.
+    """
+    document: str | None = discovery_cache.get_static_doc("gmail", "v1")
+    return document
 
 
 def _extract_plain_body(parts: list) -> str | None:
@@ -497,16 +516,9 @@ def _clean_text(text: str) -> str:
     Returns:
         str: Cleaned text.
     """
-    # Replace multiple newlines with a single newline
-    text = re.sub(r"\n+", "\n", text)
-
-    # Replace multiple spaces with a single space
-    text = re.sub(r"\s+", " ", text)
-
-    # Remove leading/trailing whitespace from each line
-    text = "\n".join(line.strip() for line in text.split("\n"))
-
-    return text
+    # Collapse every run of whitespace, newlines included, into a single space.
+    # No newlines are left afterwards, so the text is a single line to strip.
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
 
 
 def _update_datetime(day: Day | None, time: TimeSlot | None, time_zone: str) -> dict | None:
@@ -24,6 +24,7 @@ from arcade_google.tools import (
     write_draft_email,
 )
 from arcade_google.utils import (
+    _clean_email_body,
     build_reply_body,
     parse_draft_email,
     parse_multipart_email,
@@ -416,6 +417,15 @@ async def test_get_emails(mock_parse_plain_text_email, mock_build, mock_context)
         await list_emails(context=mock_context, n_emails=1)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("n", [0, -1])
+@patch("arcade_google.tools.gmail._build_gmail_service")
+async def test_list_emails_non_positive_count(mock_build, n, mock_context):
+    assert await list_emails(context=mock_context, n_emails=n) == {"emails": []}
+    assert await list_draft_emails(context=mock_context, n_drafts=n) == {"emails": []}
+    mock_build.assert_not_called()
+
+
 @pytest.mark.asyncio
 @patch("arcade_google.tools.gmail._build_gmail_service")
 async def test_trash_email(mock_build, mock_context):
@@ -949,3 +959,29 @@ def test_parse_multipart_email_invalid_payload_structure():
 
     with pytest.raises(TypeError):
         parse_multipart_email(email_data)
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        # Well-formed HTML
+        (
+            "<html><body><p>Hello,</p>\n<p>See the <a href='https://example.com'>report</a>.</p>"
+            "</body></html>",
+            "Hello, See the report .",
+        ),
+        ("<div>Fish &amp; chips &lt;today&gt;</div>", "Fish & chips <today>"),
+        # Malformed HTML: mismatched and unclosed tags
+        ("<p>Hi <b>there</p><div>unclosed <i>tags", "Hi there unclosed tags"),
+        ("<table><tr><td>Cell</td></table></p>trailing", "Cell trailing"),
+        # Plain text and empty bodies
+        ("  plain\n\ntext\t body ", "plain text body"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_clean_email_body(body, expected):
+    """
+    Test that HTML is stripped from email bodies and whitespace is collapsed.
+    """
+    assert _clean_email_body(body) == expected